@@ -1,65 +1,133 @@
-from datetime import date, datetime, time
-from typing import Any, Dict, Literal
-from uuid import UUID
-
-from pydantic import AnyUrl
+import math
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Callable, Dict, Literal, Pattern, Union
 
 from .interfaces import IConstraintBuilder
+from .resolvers import FORMAT_TYPE_MAP
 
 EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 
+# JSON Schema keywords mapped to Pydantic Field arguments. Later entries take
+# precedence when two keywords map to the same argument (e.g. minItems).
+STRING_CONSTRAINT_MAP = {
+    "minLength": "min_length",
+    "maxLength": "max_length",
+    "pattern": "pattern",
+}
+VALUE_CONSTRAINT_MAP = {
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "multipleOf": "multiple_of",
+    "minItems": "min_length",
+    "maxItems": "max_length",
+}
+
+# String formats that are enforced by a dedicated type instead of constraints;
+# email stays a str checked against EMAIL_PATTERN
+FORMAT_TYPES = {
+    format_name: format_type
+    for format_name, format_type in FORMAT_TYPE_MAP.items()
+    if format_name != "email"
+}
+
+# Look-around and backreferences are not supported by pydantic-core's Rust regex
+# engine; such patterns are handed to pydantic precompiled so it uses Python's re
+PYTHON_REGEX_FEATURES = re.compile(r"\(\?<?[=!]|\\[1-9]")
+
+
+def _merge_multiple_of(first: float, second: float) -> float:
+    """Returns the least common multiple, which satisfies both multipleOf constraints."""
+    if isinstance(first, int) and isinstance(second, int):
+        return math.lcm(first, second)
+    # lcm(a/b, c/d) == lcm(a, c) / gcd(b, d) for fractions in lowest terms
+    first_fraction, second_fraction = Fraction(str(first)), Fraction(str(second))
+    return float(
+        Fraction(
+            math.lcm(first_fraction.numerator, second_fraction.numerator),
+            math.gcd(first_fraction.denominator, second_fraction.denominator),
+        )
+    )
+
+
+@lru_cache(maxsize=512)
+def _merge_patterns(first: str, second: str) -> str:
+    """Combines two patterns with AND logic, each of them matching anywhere in the string."""
+    return rf"^(?=[\s\S]*?(?:{first}))(?=[\s\S]*?(?:{second}))"
+
+
+# How allOf merges a keyword present in both schemas; lower bounds take the
+# larger value and upper bounds the smaller one
+MERGE_OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "minimum": max,
+    "maximum": min,
+    "exclusiveMinimum": max,
+    "exclusiveMaximum": min,
+    "multipleOf": _merge_multiple_of,
+    "minLength": max,
+    "maxLength": min,
+    "minItems": max,
+    "maxItems": min,
+    "pattern": _merge_patterns,
+}
+MERGEABLE_KEYS = frozenset(MERGE_OPERATIONS)
+
+# Keywords that can give a schema field constraints. A const alone only yields its
+# Literal type, which the type resolver builds for the annotation instead.
+CONSTRAINT_KEYS = frozenset({*STRING_CONSTRAINT_MAP, *VALUE_CONSTRAINT_MAP, "format"})
+
 
 class ConstraintBuilder(IConstraintBuilder):
     """Builds Pydantic field constraints from JSON Schema"""
 
+    def __init__(self):
+        self._pattern_cache: Dict[str, Union[str, Pattern[str]]] = {}
+
+    def _get_pattern(self, pattern: str) -> Union[str, Pattern[str]]:
+        """Returns the pattern, precompiled once if it needs Python's regex engine."""
+        try:
+            return self._pattern_cache[pattern]
+        except KeyError:
+            pass
+        compiled: Union[str, Pattern[str]] = pattern
+        if PYTHON_REGEX_FEATURES.search(pattern):
+            try:
+                compiled = re.compile(pattern)
+            except re.error:
+                pass  # Leave invalid patterns for pydantic to report
+        self._pattern_cache[pattern] = compiled
+        return compiled
+
     def build_constraints(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Extract field constraints from schema."""
-        constraints = {}
-
-        # String constraints
-        if "minLength" in schema:
-            constraints["min_length"] = schema["minLength"]
-        if "maxLength" in schema:
-            constraints["max_length"] = schema["maxLength"]
-        if "pattern" in schema:
-            constraints["pattern"] = schema["pattern"]
         # Handle const values first
         if "const" in schema:
             return Literal[schema["const"]]
+        if CONSTRAINT_KEYS.isdisjoint(schema):
+            return {}
+
+        # String constraints
+        constraints = {
+            arg: schema[key] for key, arg in STRING_CONSTRAINT_MAP.items() if key in schema
+        }
+        if isinstance(constraints.get("pattern"), str):
+            constraints["pattern"] = self._get_pattern(constraints["pattern"])
 
         if "format" in schema:
             format_type = schema["format"]
             if format_type == "email":
                 constraints["pattern"] = EMAIL_PATTERN
                 return constraints
-            elif format_type == "date-time":
-                return datetime
-            elif format_type == "date":
-                return date
-            elif format_type == "time":
-                return time
-            elif format_type == "uri":
-                return AnyUrl
-            elif format_type == "uuid":
-                return UUID
-
-        # Number constraints
-        if "minimum" in schema:
-            constraints["ge"] = schema["minimum"]
-        if "maximum" in schema:
-            constraints["le"] = schema["maximum"]
-        if "exclusiveMinimum" in schema:
-            constraints["gt"] = schema["exclusiveMinimum"]
-        if "exclusiveMaximum" in schema:
-            constraints["lt"] = schema["exclusiveMaximum"]
-        if "multipleOf" in schema:
-            constraints["multiple_of"] = schema["multipleOf"]
-
-        # Array constraints
-        if "minItems" in schema:
-            constraints["min_length"] = schema["minItems"]
-        if "maxItems" in schema:
-            constraints["max_length"] = schema["maxItems"]
+            if isinstance(format_type, str) and format_type in FORMAT_TYPES:
+                return FORMAT_TYPES[format_type]
+
+        # Number and array constraints
+        for key, arg in VALUE_CONSTRAINT_MAP.items():
+            if key in schema:
+                constraints[arg] = schema[key]
 
         return constraints
 
@@ -69,45 +137,13 @@ class ConstraintBuilder(IConstraintBuilder):
         """Merges constraints from two schemas for the same property."""
         merged = schema1.copy()
 
-        # Handle numeric constraints
-        for constraint in [
-            "minimum",
-            "maximum",
-            "exclusiveMinimum",
-            "exclusiveMaximum",
-            "multipleOf",
-        ]:
-            if constraint in schema2:
-                if constraint in merged:
-                    if "minimum" in constraint or "exclusiveMinimum" in constraint:
-                        merged[constraint] = max(
-                            merged[constraint], schema2[constraint]
-                        )
-                    else:
-                        merged[constraint] = min(
-                            merged[constraint], schema2[constraint]
-                        )
-                else:
-                    merged[constraint] = schema2[constraint]
-
-        # Handle string constraints
-        for constraint in ["minLength", "maxLength", "pattern"]:
-            if constraint in schema2:
-                if constraint in merged:
-                    if "min" in constraint.lower():
-                        merged[constraint] = max(
-                            merged[constraint], schema2[constraint]
-                        )
-                    elif "max" in constraint.lower():
-                        merged[constraint] = min(
-                            merged[constraint], schema2[constraint]
-                        )
-                    else:
-                        # For pattern, combine with AND logic
-                        merged[constraint] = (
-                            f"(?={merged[constraint]})(?={schema2[constraint]})"
-                        )
-                else:
-                    merged[constraint] = schema2[constraint]
+        for constraint, value in schema2.items():
+            merge = MERGE_OPERATIONS.get(constraint)
+            if merge is None:
+                continue
+            if constraint in merged:
+                merged[constraint] = merge(merged[constraint], value)
+            else:
+                merged[constraint] = value
 
         return merged
@@ -1,4 +1,4 @@
-from typing import Annotated, Any, Callable, Dict, List, Literal, Type, Union
+from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from pydantic import (
     BaseModel,
@@ -9,6 +9,7 @@ from pydantic import (
     create_model,
 )
 
+from .builders import MERGEABLE_KEYS
 from .exceptions import CombinerError
 from .interfaces import (
     ICombinerHandler,
@@ -16,6 +17,23 @@ from .interfaces import (
     IReferenceResolver,
     ITypeResolver,
 )
+from .resolvers import PRIMITIVE_TYPE_MAP
+
+# Combiner models forbid extra fields; share one config per populate_by_name value
+FORBID_EXTRA_CONFIGS = {
+    populate_by_name: ConfigDict(extra="forbid", populate_by_name=populate_by_name)
+    for populate_by_name in (False, True)
+}
+
+# Discriminated oneOf variants are validated through their union, whose build
+# generates their schemas inline; building each variant's own validator is
+# deferred until the variant model is used directly
+VARIANT_CONFIGS = {
+    populate_by_name: ConfigDict(
+        extra="forbid", populate_by_name=populate_by_name, defer_build=True
+    )
+    for populate_by_name in (False, True)
+}
 
 
 class CombinerHandler(ICombinerHandler):
@@ -38,6 +56,16 @@ class CombinerHandler(ICombinerHandler):
         self.recursive_field_builder = recursive_field_builder
         self.field_info_builder = field_info_builder
         self.name_sanitizer = name_sanitizer
+        # Union specializations keyed by their variant types
+        self._union_cache: Dict[Tuple[Any, ...], Any] = {}
+        self._discriminated_union_cache: Dict[Tuple[Any, ...], Any] = {}
+        # oneOf variant models keyed by schema id, ref and build options; the
+        # schema is kept to detect id reuse
+        self._variant_models: Dict[Tuple[Any, ...], Tuple[Any, Type[BaseModel]]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget variant models, e.g. when root schemas may have changed."""
+        self._variant_models.clear()
 
     def handle_all_of(
         self,
@@ -50,14 +78,12 @@ class CombinerHandler(ICombinerHandler):
         """Combines multiple schemas with AND logic."""
         if not schemas:
             raise CombinerError("allOf must contain at least one schema")
+        self._check_schemas(schemas, "allOf")
 
         merged_properties = {}
         required_fields = set()
 
         for schema in schemas:
-            if not isinstance(schema, dict):
-                raise CombinerError(f"Invalid schema in allOf: {schema}")
-
             # Resolve top-level $ref
             if "$ref" in schema:
                 schema = self.reference_resolver.resolve_ref(
@@ -67,23 +93,29 @@ class CombinerHandler(ICombinerHandler):
             properties = schema.get("properties", {})
             required = schema.get("required", [])
 
-            for prop_name, prop_schema in properties.items():
-                if prop_name in merged_properties:
-                    # Merge constraints for existing property using the injected constraint_builder
-                    merged_properties[prop_name] = (
-                        self.constraint_builder.merge_constraints(
-                            merged_properties[prop_name], prop_schema
+            # Members that add only new properties, the common case, need no merging
+            if merged_properties.keys().isdisjoint(properties):
+                merged_properties.update(properties)
+            else:
+                for prop_name, prop_schema in properties.items():
+                    if prop_name not in merged_properties:
+                        merged_properties[prop_name] = prop_schema
+                    elif not MERGEABLE_KEYS.isdisjoint(prop_schema):
+                        # Merge constraints for existing property using the injected constraint_builder
+                        merged_properties[prop_name] = (
+                            self.constraint_builder.merge_constraints(
+                                merged_properties[prop_name], prop_schema
+                            )
                         )
-                    )
-                else:
-                    merged_properties[prop_name] = prop_schema
+                    # Without mergeable constraints the existing schema is kept as is
 
             required_fields.update(required)
 
         # Build field definitions using the callbacks
         field_definitions = {}
+        property_names = merged_properties.keys()
         for name, prop_schema in merged_properties.items():
-            sanitized_name, alias = self.name_sanitizer(name, set(merged_properties))
+            sanitized_name, alias = self.name_sanitizer(name, property_names)
             field_type = self.recursive_field_builder(
                 prop_schema,
                 root_schema,
@@ -96,7 +128,7 @@ class CombinerHandler(ICombinerHandler):
 
         return create_model(
             "AllOfModel",
-            __config__=ConfigDict(extra="forbid", populate_by_name=populate_by_name),
+            __config__=FORBID_EXTRA_CONFIGS[populate_by_name],
             **field_definitions,
         )
 
@@ -111,20 +143,13 @@ class CombinerHandler(ICombinerHandler):
         """Allows validation against any of the given schemas."""
         if not schemas:
             raise CombinerError("anyOf must contain at least one schema")
+        self._check_schemas(schemas, "anyOf")
 
         possible_types = []
         for schema in schemas:
-            if not isinstance(schema, dict):
-                raise CombinerError(f"Invalid schema in anyOf: {schema}")
-
-            # Resolve $ref if present
-            if "$ref" in schema:
-                schema = self.reference_resolver.resolve_ref(
-                    schema["$ref"], schema, root_schema
-                )
-
-            # Use the recursive_field_builder callback to resolve the type
-            resolved_type = self.recursive_field_builder(
+            # Let recursive_field_builder handle $ref resolution, so referenced
+            # models are built once and shared with every other use of the ref
+            resolved_type = self._resolve_variant_type(
                 schema,
                 root_schema,
                 allow_undefined_array_items,
@@ -133,7 +158,7 @@ class CombinerHandler(ICombinerHandler):
             )
             possible_types.append(resolved_type)
 
-        return Union[tuple(possible_types)]
+        return self._make_union(tuple(possible_types))
 
     def handle_one_of(
         self,
@@ -152,18 +177,15 @@ class CombinerHandler(ICombinerHandler):
         """
         if not schemas:
             raise CombinerError("oneOf must contain at least one schema")
+        # Validated once here, so the pattern checks below can assume schema objects
+        self._check_schemas(schemas, "oneOf")
 
         # Check for const/literal union pattern
-        # Example: {"oneOf": [{"const": "a"}, {"const": "b"}]}
-        if all(isinstance(s, dict) and "const" in s for s in schemas):
-            const_values = tuple(s["const"] for s in schemas)
-            # Only use Literal if all const values are valid Literal types
-            # (str, int, bool, bytes, None, Enum members)
-            if all(
-                isinstance(v, (str, int, bool, bytes, type(None))) for v in const_values
-            ):
-                return Literal[const_values]
-            # Fall through to general union handling for complex const types
+        # Example: {"oneOf": [{"const": "a"}, {"enum": ["b", "c"]}]}
+        const_values = self._get_constant_values(schemas)
+        if const_values is not None:
+            return Literal[const_values]
+        # Fall through to general union handling for complex const types
 
         # Check for discriminated union pattern (objects with type const)
         if self._is_discriminated_union(schemas, root_schema):
@@ -185,14 +207,43 @@ class CombinerHandler(ICombinerHandler):
             populate_by_name,
         )
 
+    @staticmethod
+    def _check_schemas(schemas: List[Any], combiner: str) -> None:
+        """Raises a CombinerError for the first combiner entry that is not a schema object."""
+        for schema in schemas:
+            if not isinstance(schema, dict):
+                raise CombinerError(f"Invalid schema in {combiner}: {schema}")
+
+    @staticmethod
+    def _get_constant_values(schemas: List[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Collects the values of a oneOf made only of const or enum variants.
+        Returns None if any variant is not constant, a value is not a valid Literal
+        type (str, int, bool, bytes, None), or enum values overlap between variants.
+        """
+        values = []
+        has_enum = False
+        for schema in schemas:
+            if "const" in schema:
+                values.append(schema["const"])
+            elif isinstance(schema.get("enum"), list) and schema["enum"]:
+                values.extend(schema["enum"])
+                has_enum = True
+            else:
+                return None
+
+        if not all(isinstance(v, (str, int, bool, bytes, type(None))) for v in values):
+            return None
+        # A value matching several enum variants would fail oneOf validation
+        if has_enum and len(set(values)) != len(values):
+            return None
+        return tuple(values)
+
     def _is_discriminated_union(
         self, schemas: List[Dict[str, Any]], root_schema: Dict[str, Any]
     ) -> bool:
         """Check if all schemas are objects with a type const discriminator."""
         for schema in schemas:
-            if not isinstance(schema, dict):
-                return False
-
             # Resolve $ref if present
             resolved = schema
             if "$ref" in schema:
@@ -220,9 +271,6 @@ class CombinerHandler(ICombinerHandler):
         variant_models = {}
 
         for variant_schema in schemas:
-            if not isinstance(variant_schema, dict):
-                raise CombinerError(f"Invalid schema in oneOf: {variant_schema}")
-
             # Resolve $ref if present at the variant level
             ref_path = None
             if "$ref" in variant_schema:
@@ -234,30 +282,37 @@ class CombinerHandler(ICombinerHandler):
             properties = variant_schema.get("properties", {})
             type_const = properties.get("type", {}).get("const")
 
+            # Variants shared by several oneOfs, usually through a $ref, are built once
+            cache_key = (
+                id(variant_schema),
+                ref_path,
+                allow_undefined_array_items,
+                allow_undefined_type,
+                populate_by_name,
+            )
+            cached = self._variant_models.get(cache_key)
+            if cached is not None and cached[0] is variant_schema:
+                variant_models[type_const] = cached[1]
+                continue
+
             # Create field definitions for this variant
             fields = {}
-            required = variant_schema.get("required", [])
+            required = frozenset(variant_schema.get("required") or ())
+            property_names = properties.keys()
 
             for name, prop_schema in properties.items():
                 if name == "type":
                     description = prop_schema.get("description")
+                    # A bare default avoids building a FieldInfo when there is no description
                     fields[name] = (
                         Literal[type_const],
-                        Field(default=type_const, description=description),
-                    )
-                elif "oneOf" in prop_schema:
-                    sanitized_name, alias = self.name_sanitizer(name, set(properties))
-                    field_type = self.recursive_field_builder(
-                        prop_schema,
-                        root_schema,
-                        allow_undefined_array_items,
-                        allow_undefined_type,
-                        populate_by_name,
+                        Field(default=type_const, description=description)
+                        if description is not None
+                        else type_const,
                     )
-                    field_info = self.field_info_builder(prop_schema, name in required, alias=alias)
-                    fields[sanitized_name] = (field_type, field_info)
-                elif name != "type":
-                    sanitized_name, alias = self.name_sanitizer(name, set(properties))
+                else:
+                    # Nested oneOfs are handled by the recursive builder like any other field
+                    sanitized_name, alias = self.name_sanitizer(name, property_names)
                     field_type = self.recursive_field_builder(
                         prop_schema,
                         root_schema,
@@ -270,26 +325,23 @@ class CombinerHandler(ICombinerHandler):
 
             # Use the name from the $ref if available, otherwise generate one
             if ref_path:
-                model_name = ref_path.split("/")[-1]
+                model_name = ref_path.rpartition("/")[2]
             else:
                 model_name = f"Variant_{type_const}"
 
             variant_model = create_model(
                 model_name,
-                __config__=ConfigDict(extra="forbid", populate_by_name=populate_by_name),
+                __config__=VARIANT_CONFIGS[populate_by_name],
                 **fields,
             )
             variant_models[type_const] = variant_model
+            self._variant_models[cache_key] = (variant_schema, variant_model)
 
         # Always wrap in RootModel for consistent access pattern
-        if len(variant_models) == 1:
-            return RootModel[list(variant_models.values())[0]]
-        else:
-            union_type = Annotated[
-                Union[tuple(variant_models.values())],
-                Discriminator(discriminator="type"),
-            ]
-            return RootModel[union_type]
+        models = tuple(variant_models.values())
+        if len(models) == 1:
+            return RootModel[models[0]]
+        return self._make_discriminated_union(models)
 
     def _handle_union(
         self,
@@ -302,11 +354,8 @@ class CombinerHandler(ICombinerHandler):
         """Handle oneOf as a union type (like anyOf)."""
         possible_types = []
         for schema in schemas:
-            if not isinstance(schema, dict):
-                raise CombinerError(f"Invalid schema in oneOf: {schema}")
-
             # Let recursive_field_builder handle $ref resolution
-            resolved_type = self.recursive_field_builder(
+            resolved_type = self._resolve_variant_type(
                 schema,
                 root_schema,
                 allow_undefined_array_items,
@@ -315,4 +364,50 @@ class CombinerHandler(ICombinerHandler):
             )
             possible_types.append(resolved_type)
 
-        return Union[tuple(possible_types)]
+        return self._make_union(tuple(possible_types))
+
+    def _resolve_variant_type(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+    ) -> Any:
+        """Resolves the type of a union variant, looking bare primitive types up directly."""
+        # Variants such as {"type": "string"} or {"type": "null"} need no further resolution
+        if len(schema) == 1:
+            schema_type = schema.get("type")
+            if schema_type == "null":
+                return type(None)
+            if isinstance(schema_type, str) and schema_type in PRIMITIVE_TYPE_MAP:
+                return PRIMITIVE_TYPE_MAP[schema_type]
+        return self.recursive_field_builder(
+            schema,
+            root_schema,
+            allow_undefined_array_items,
+            allow_undefined_type,
+            populate_by_name,
+        )
+
+    def _make_union(self, types: Tuple[Any, ...]) -> Any:
+        """Returns the Union of the given types, reusing earlier specializations."""
+        try:
+            return self._union_cache[types]
+        except KeyError:
+            union_type = self._union_cache[types] = Union[types]
+            return union_type
+        except TypeError:
+            # Unhashable annotations cannot be cached
+            return Union[types]
+
+    def _make_discriminated_union(self, models: Tuple[Type[BaseModel], ...]) -> Any:
+        """Returns a RootModel over a "type"-discriminated union of the given models."""
+        root_model = self._discriminated_union_cache.get(models)
+        if root_model is None:
+            union_type = Annotated[
+                self._make_union(models),
+                Discriminator(discriminator="type"),
+            ]
+            root_model = self._discriminated_union_cache[models] = RootModel[union_type]
+        return root_model
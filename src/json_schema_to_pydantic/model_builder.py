@@ -1,89 +1,125 @@
-from typing import Annotated, Any, Dict, List, Optional, Set, Type, TypeVar
+import hashlib
+import json
+from typing import AbstractSet, Annotated, Any, Dict, Hashable, List, Optional, Set, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel, TypeAdapter, create_model
 
-from . import SchemaError
-from .builders import ConstraintBuilder
+from .builders import CONSTRAINT_KEYS, ConstraintBuilder
+from .exceptions import SchemaError
+from .exceptions import TypeError as SchemaTypeError
 from .handlers import CombinerHandler
 from .interfaces import IModelBuilder
-from .resolvers import ReferenceResolver, TypeResolver
+from .resolvers import ReferenceResolver, TypeResolver, intern_type
 
 T = TypeVar("T", bound=BaseModel)
 
+# Combiner keywords in order of precedence, with the CombinerHandler method for each
+COMBINER_HANDLERS = {
+    "allOf": "handle_all_of",
+    "anyOf": "handle_any_of",
+    "oneOf": "handle_one_of",
+}
+COMBINER_KEYS = frozenset(COMBINER_HANDLERS)
+
+# Models only differ in populate_by_name; share one config per value
+POPULATE_BY_NAME_CONFIGS = {
+    populate_by_name: ConfigDict(populate_by_name=populate_by_name)
+    for populate_by_name in (False, True)
+}
+
+# Schema keywords whose field types are expensive enough to memoize
+COMPOUND_SCHEMA_KEYS = frozenset({*COMBINER_KEYS, "items", "properties"})
+
+
+def _digest(canonical: bytes) -> bytes:
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+# Encodes schema leaves for digests canonically: sorted keys, no whitespace
+CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+# Stands for a nested schema object in a digest encoding and is followed by that
+# object's fixed-size digest; no JSON value starts with it
+NESTED_DIGEST_MARKER = b"#"
+
 
 class PydanticModelBuilder(IModelBuilder[T]):
     """Creates Pydantic models from JSON Schema definitions"""
 
     # Standard JSON Schema properties for fields
-    STANDARD_FIELD_PROPERTIES = {
-        "type",
-        "format",
-        "description",
-        "default",
-        "title",
-        "examples",
-        "const",
-        "enum",
-        "multipleOf",
-        "maximum",
-        "exclusiveMaximum",
-        "minimum",
-        "exclusiveMinimum",
-        "maxLength",
-        "minLength",
-        "pattern",
-        "items",
-        "additionalItems",
-        "maxItems",
-        "minItems",
-        "uniqueItems",
-        "properties",
-        "additionalProperties",
-        "required",
-        "patternProperties",
-        "dependencies",
-        "propertyNames",
-        "if",
-        "then",
-        "else",
-        "allOf",
-        "anyOf",
-        "oneOf",
-        "not",
-        "$ref",
-        "$defs",
-        "definitions",
-    }
+    STANDARD_FIELD_PROPERTIES = frozenset(
+        {
+            "type",
+            "format",
+            "description",
+            "default",
+            "title",
+            "examples",
+            "const",
+            "enum",
+            "multipleOf",
+            "maximum",
+            "exclusiveMaximum",
+            "minimum",
+            "exclusiveMinimum",
+            "maxLength",
+            "minLength",
+            "pattern",
+            "items",
+            "additionalItems",
+            "maxItems",
+            "minItems",
+            "uniqueItems",
+            "properties",
+            "additionalProperties",
+            "required",
+            "patternProperties",
+            "dependencies",
+            "propertyNames",
+            "if",
+            "then",
+            "else",
+            "allOf",
+            "anyOf",
+            "oneOf",
+            "not",
+            "$ref",
+            "$defs",
+            "definitions",
+        }
+    )
 
     # Standard JSON Schema properties for models
-    STANDARD_MODEL_PROPERTIES = {
-        "type",
-        "title",
-        "description",
-        "properties",
-        "required",
-        "additionalProperties",
-        "patternProperties",
-        "dependencies",
-        "propertyNames",
-        "if",
-        "then",
-        "else",
-        "allOf",
-        "anyOf",
-        "oneOf",
-        "not",
-        "$ref",
-        "$defs",
-        "definitions",
-        "$schema",
-        "$id",
-        "$comment",
-        "items",
-        "minItems",
-        "maxItems",
-        "uniqueItems",
-    }
+    STANDARD_MODEL_PROPERTIES = frozenset(
+        {
+            "type",
+            "title",
+            "description",
+            "properties",
+            "required",
+            "additionalProperties",
+            "patternProperties",
+            "dependencies",
+            "propertyNames",
+            "if",
+            "then",
+            "else",
+            "allOf",
+            "anyOf",
+            "oneOf",
+            "not",
+            "$ref",
+            "$defs",
+            "definitions",
+            "$schema",
+            "$id",
+            "$comment",
+            "items",
+            "minItems",
+            "maxItems",
+            "uniqueItems",
+        }
+    )
 
     def __init__(
         self,
@@ -92,9 +128,9 @@ class PydanticModelBuilder(IModelBuilder[T]):
         predefined_refs: Optional[Dict[str, Any]] = None,
     ):
         # Instantiate resolvers and builders directly
-        self.type_resolver = TypeResolver()
+        self.reference_resolver = ReferenceResolver(cache_refs=True)
+        self.type_resolver = TypeResolver(reference_resolver=self.reference_resolver)
         self.constraint_builder = ConstraintBuilder()
-        self.reference_resolver = ReferenceResolver()
         # Pass resolvers and method references as callbacks to CombinerHandler
         self.combiner_handler = CombinerHandler(
             type_resolver=self.type_resolver,
@@ -122,6 +158,15 @@ class PydanticModelBuilder(IModelBuilder[T]):
         self._ref_type_cache: Dict[str, Any] = dict(validated_predefined_refs)
         self._building_models: Set[str] = set()
         self._models_to_rebuild: Set[Type[BaseModel]] = set()
+        # Track inline object schemas being built, by id, to support cyclic schemas
+        self._inline_models_in_progress: Dict[int, str] = {}
+        self._recursive_inline_schemas: Set[int] = set()
+        # Memoize built models by the canonical content of their schema
+        self._schema_model_cache: Dict[Hashable, Type[BaseModel]] = {}
+        # Content digests of schema objects by id, kept for a single top-level call
+        self._schema_digests: Dict[int, Tuple[Any, Optional[Tuple[bytes, bool]]]] = {}
+        self._call_depth = 0
+        self._field_type_cache: Dict[Hashable, Any] = {}
 
     @staticmethod
     def _validate_ref_key(ref: Any, mapping_name: str) -> str:
@@ -194,10 +239,21 @@ class PydanticModelBuilder(IModelBuilder[T]):
             validated[ref] = annotation
         return validated
 
+    @staticmethod
+    def _get_schema_extra(
+        schema: Dict[str, Any], standard_properties: AbstractSet[str]
+    ) -> Dict[str, Any]:
+        """Returns the non-standard keywords of a schema, in schema order."""
+        # Most schemas only use standard keywords, which a C-level subset test finds
+        # without looping over every key in Python
+        if schema.keys() <= standard_properties:
+            return {}
+        return {key: value for key, value in schema.items() if key not in standard_properties}
+
     @staticmethod
     def _get_ref_title(ref: str) -> str:
-        ref_parts = ref.split("/")
-        return ref_parts[-1] if ref_parts else "DynamicModel"
+        """Returns the last segment of a ref, which names the model built for it."""
+        return ref.rpartition("/")[2]
 
     def _create_predefined_type_root_model(self, ref: str) -> Type[T]:
         """Wrap a predefined non-model ref type into a RootModel for top-level $ref schemas."""
@@ -205,6 +261,103 @@ class PydanticModelBuilder(IModelBuilder[T]):
         title = self._get_ref_title(ref)
         return type(title, (RootModel[value_type],), {})
 
+    def _get_schema_digest(self, schema: Dict[str, Any]) -> Optional[Tuple[bytes, bool]]:
+        """Returns the content digest of a schema object and whether it contains a $ref.
+
+        Nested objects contribute their own digest rather than their content, so each
+        object is encoded once per top-level call however deeply it is nested. Returns
+        None for schemas holding values that are not plain JSON, or cycles.
+        """
+        entry = self._schema_digests.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+        # Keep a reference to the schema so its id cannot be reused; the placeholder
+        # makes a cycle back to this object come out as uncacheable
+        self._schema_digests[id(schema)] = (schema, None)
+        try:
+            encoded, has_ref = self._encode_schema_value(schema, nested=False)
+        except (TypeError, ValueError):
+            return None
+        result = (_digest(encoded), has_ref or "$ref" in schema)
+        self._schema_digests[id(schema)] = (schema, result)
+        return result
+
+    def _encode_schema_value(self, value: Any, nested: bool = True) -> Tuple[bytes, bool]:
+        """Encodes a schema value for its digest, along with whether it contains a $ref."""
+        if isinstance(value, dict):
+            if nested:
+                digest = self._get_schema_digest(value)
+                if digest is None:
+                    raise TypeError("Schema is not plain JSON")
+                return NESTED_DIGEST_MARKER + digest[0], digest[1]
+            items = value.items()
+        elif isinstance(value, list):
+            items = None
+        else:
+            return CANONICAL_JSON_ENCODER.encode(value).encode(), False
+
+        # Containers without nested containers, most schema leaves, encode in one call
+        values = value.values() if items is not None else value
+        if not any(isinstance(item, (dict, list)) for item in values):
+            return CANONICAL_JSON_ENCODER.encode(value).encode(), False
+
+        has_ref = False
+        parts = []
+        if items is None:
+            for item in value:
+                encoded, item_has_ref = self._encode_schema_value(item)
+                has_ref = has_ref or item_has_ref
+                parts.append(encoded)
+            return b"[" + b",".join(parts) + b"]", has_ref
+        for key, item in sorted(items):
+            if not isinstance(key, str):
+                raise TypeError("Schema keys must be strings")
+            encoded, item_has_ref = self._encode_schema_value(item)
+            has_ref = has_ref or item_has_ref
+            parts.append(CANONICAL_JSON_ENCODER.encode(key).encode() + b":" + encoded)
+        return b"{" + b",".join(parts) + b"}", has_ref
+
+    def _get_schema_cache_key(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Any,
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+        schema_ref: Optional[str],
+    ) -> Optional[Hashable]:
+        """Builds the memoization key for a schema, or None if it cannot be cached.
+
+        The key combines the schema's content digest, the root schema's digest (only
+        when the schema contains a $ref, since only then can the root change the
+        result), the build options and the ref the schema was reached through, which
+        names the model. Digests are only reused within a top-level call, so root
+        schemas mutated between calls get fresh keys.
+        """
+        schema_digest = self._get_schema_digest(schema)
+        if schema_digest is None:
+            return None
+        content_digest, has_ref = schema_digest
+
+        # The root only matters when the schema contains references into it
+        root_digest = None
+        if root_schema is not schema and has_ref:
+            if not isinstance(root_schema, dict):
+                return None
+            root_schema_digest = self._get_schema_digest(root_schema)
+            if root_schema_digest is None:
+                return None
+            root_digest = root_schema_digest[0]
+
+        return (
+            content_digest,
+            root_digest,
+            allow_undefined_array_items,
+            allow_undefined_type,
+            populate_by_name,
+            schema_ref,
+        )
+
     def create_pydantic_model(
         self,
         schema: Dict[str, Any],
@@ -217,6 +370,9 @@ class PydanticModelBuilder(IModelBuilder[T]):
         """
         Creates a Pydantic model from a JSON Schema definition.
 
+        Structurally identical schemas are only built once per builder; later calls
+        return the cached model.
+
         Args:
             schema: The JSON Schema to convert
             root_schema: The root schema containing definitions
@@ -231,6 +387,160 @@ class PydanticModelBuilder(IModelBuilder[T]):
         if root_schema is None:
             root_schema = schema
 
+        self._call_depth += 1
+        try:
+            return self._create_cached_model(
+                schema,
+                root_schema,
+                allow_undefined_array_items,
+                allow_undefined_type,
+                populate_by_name,
+                _schema_ref,
+            )
+        finally:
+            self._call_depth -= 1
+            if not self._call_depth:
+                # Root schemas may be mutated between calls, so their digests, resolved
+                # references and oneOf variants are only reused within a top-level call
+                self._schema_digests.clear()
+                self.reference_resolver.clear_cache()
+                self.combiner_handler.clear_cache()
+
+    def _create_cached_model(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+        _schema_ref: Optional[str],
+    ) -> Type[T]:
+        """Returns the memoized model for a schema, building it on a cache miss."""
+        cache_key = self._get_schema_cache_key(
+            schema,
+            root_schema,
+            allow_undefined_array_items,
+            allow_undefined_type,
+            populate_by_name,
+            _schema_ref,
+        )
+        if cache_key is not None and cache_key in self._schema_model_cache:
+            return self._schema_model_cache[cache_key]
+
+        if cache_key is not None:
+            # Build nested objects bottom-up so the recursive build only hits the cache
+            self._build_nested_models(
+                schema,
+                root_schema,
+                allow_undefined_array_items,
+                allow_undefined_type,
+                populate_by_name,
+            )
+
+        model = self._build_pydantic_model(
+            schema,
+            root_schema,
+            allow_undefined_array_items,
+            allow_undefined_type,
+            populate_by_name,
+            _schema_ref,
+        )
+
+        if cache_key is not None:
+            self._schema_model_cache[cache_key] = model
+        return model
+
+    @staticmethod
+    def _is_inline_object_schema(schema: Any) -> bool:
+        """Checks if a schema is an object built directly as a nested model."""
+        return (
+            isinstance(schema, dict)
+            and schema.get("type") == "object"
+            and "properties" in schema
+            and "$ref" not in schema
+            and COMBINER_KEYS.isdisjoint(schema)
+        )
+
+    def _collect_nested_object_schemas(self, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collects the inline object schemas below a schema, ordered children first.
+
+        Only properties and array items are followed; references and combiners are
+        left to the regular build, which tracks their own state.
+        """
+        if not self._is_inline_object_schema(schema):
+            return []
+
+        collected = []
+        visited = {id(schema)}
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if node.get("type") == "array":
+                children = [node.get("items")]
+            else:
+                properties = node.get("properties")
+                children = list(properties.values()) if isinstance(properties, dict) else []
+
+            for child in children:
+                if not isinstance(child, dict) or id(child) in visited:
+                    continue
+                if self._is_inline_object_schema(child):
+                    collected.append(child)
+                elif not (
+                    child.get("type") == "array"
+                    and "$ref" not in child
+                    and COMBINER_KEYS.isdisjoint(child)
+                ):
+                    continue
+                visited.add(id(child))
+                stack.append(child)
+
+        # Every object is collected before its descendants, so reverse for a bottom-up build
+        collected.reverse()
+        return collected
+
+    def _build_nested_models(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+    ) -> None:
+        """Builds and caches the nested object models of a schema without recursing."""
+        for nested_schema in self._collect_nested_object_schemas(schema):
+            # A schema already being built further up resolves to a forward reference
+            if id(nested_schema) in self._inline_models_in_progress:
+                continue
+            cache_key = self._get_schema_cache_key(
+                nested_schema,
+                root_schema,
+                allow_undefined_array_items,
+                allow_undefined_type,
+                populate_by_name,
+                None,
+            )
+            if cache_key is None or cache_key in self._schema_model_cache:
+                continue
+            self._schema_model_cache[cache_key] = self._build_pydantic_model(
+                nested_schema,
+                root_schema,
+                allow_undefined_array_items,
+                allow_undefined_type,
+                populate_by_name,
+                None,
+            )
+
+    def _build_pydantic_model(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+        _schema_ref: Optional[str],
+    ) -> Type[T]:
+        """Builds a Pydantic model from a JSON Schema definition without memoization."""
         # Store the original ref if present for tracking
         # Use the passed ref or extract from schema
         original_ref = _schema_ref or schema.get("$ref")
@@ -256,30 +566,14 @@ class PydanticModelBuilder(IModelBuilder[T]):
             )
 
         # Handle combiners
-        if "allOf" in schema:
-            return self.combiner_handler.handle_all_of(
-                schema["allOf"],
-                root_schema,
-                allow_undefined_array_items,
-                allow_undefined_type,
-                populate_by_name,
-            )
-        if "anyOf" in schema:
-            return self.combiner_handler.handle_any_of(
-                schema["anyOf"],
+        if not COMBINER_KEYS.isdisjoint(schema):
+            return self._handle_combiner(
+                schema,
                 root_schema,
                 allow_undefined_array_items,
                 allow_undefined_type,
                 populate_by_name,
             )
-        if "oneOf" in schema:
-            return self.combiner_handler.handle_one_of(
-                schema["oneOf"],
-                root_schema,
-                allow_undefined_array_items,
-                allow_undefined_type,
-                populate_by_name
-            )
 
         # Handle top-level arrays
         if schema.get("type") == "array":
@@ -316,50 +610,60 @@ class PydanticModelBuilder(IModelBuilder[T]):
         # Get model properties
         # If this schema is referenced, use the ref name as the title if no title is provided
         if original_ref and "title" not in schema:
-            ref_parts = original_ref.split("/")
-            title = ref_parts[-1] if ref_parts else "DynamicModel"
+            title = self._get_ref_title(original_ref)
         else:
             title = schema.get("title", "DynamicModel")
         description = schema.get("description")
         properties = schema.get("properties", {})
-        required = schema.get("required", [])
+        required = frozenset(schema.get("required") or ())
 
         # Extract model-level json_schema_extra
-        model_extra = {
-            key: value
-            for key, value in schema.items()
-            if key not in self.STANDARD_MODEL_PROPERTIES
-        }
+        model_extra = self._get_schema_extra(schema, self.STANDARD_MODEL_PROPERTIES)
 
-        # Build field definitions
+        # Build field definitions. While they are built, a cyclic inline schema
+        # referring back to this one resolves to a forward reference by title.
         fields = {}
-        for field_name, field_schema in properties.items():
-            field_type = self._get_field_type(
-                field_schema,
-                root_schema,
-                allow_undefined_array_items,
-                allow_undefined_type,
-                populate_by_name,
-            )
-            model_field_name, alias = self._sanitize_field_name(field_name, set(properties))
-            field_info = self._build_field_info(field_schema, field_name in required, alias=alias)
-            fields[model_field_name] = (field_type, field_info)
+        property_names = properties.keys()
+        schema_id = id(schema)
+        # A $ref back to this schema builds it again nested; keep the outer entry
+        outer_title = self._inline_models_in_progress.get(schema_id)
+        self._inline_models_in_progress[schema_id] = title
+        try:
+            for field_name, field_schema in properties.items():
+                field_type = self._get_field_type(
+                    field_schema,
+                    root_schema,
+                    allow_undefined_array_items,
+                    allow_undefined_type,
+                    populate_by_name,
+                )
+                model_field_name, alias = self._sanitize_field_name(field_name, property_names)
+                field_info = self._build_field_info(field_schema, field_name in required, alias=alias)
+                fields[model_field_name] = (field_type, field_info)
+        finally:
+            if outer_title is None:
+                del self._inline_models_in_progress[schema_id]
+            else:
+                self._inline_models_in_progress[schema_id] = outer_title
 
         # Create the model with or without json_schema_extra
         if model_extra:
-            # Create a dynamic base class with the config
-            class DynamicBase(self.base_model_type):
-                model_config = ConfigDict(
-                    json_schema_extra=model_extra,
-                    populate_by_name=populate_by_name,
-                )
-
-            model = create_model(title, __base__=DynamicBase, **fields)
+            # Pass the config as class keywords; an intermediate base class carrying
+            # it would be a second model for pydantic to build
+            model = create_model(
+                title,
+                __base__=self.base_model_type,
+                __cls_kwargs__={
+                    "json_schema_extra": model_extra,
+                    "populate_by_name": populate_by_name,
+                },
+                **fields,
+            )
         else:
             model = create_model(
                 title,
                 __base__=self.base_model_type,
-                __config__=ConfigDict(populate_by_name=populate_by_name),
+                __config__=POPULATE_BY_NAME_CONFIGS[populate_by_name],
                 **fields,
             )
 
@@ -374,18 +678,35 @@ class PydanticModelBuilder(IModelBuilder[T]):
             # Mark model for rebuild after all models are created
             self._models_to_rebuild.add(model)
 
-        # If this is the top-level call (no models being built), rebuild all models
-        if not self._building_models and self._models_to_rebuild:
-            # Build namespace with all models
-            namespace = {m.__name__: m for m in self._models_to_rebuild}
-            # Rebuild all models to resolve forward references
-            for m in self._models_to_rebuild:
-                m.model_rebuild(_types_namespace=namespace)
-            # Clear the rebuild set
-            self._models_to_rebuild.clear()
+        # Resolve forward references of cyclic inline schemas to this model
+        if schema_id in self._recursive_inline_schemas:
+            self._recursive_inline_schemas.discard(schema_id)
+            self._models_to_rebuild.add(model)
+
+        # Forward references to models still being built leave the model incomplete;
+        # rebuild it with them, since it is cached and may be returned on its own
+        if not model.__pydantic_complete__:
+            self._models_to_rebuild.add(model)
+
+        self._rebuild_pending_models()
 
         return model
 
+    def _rebuild_pending_models(self) -> None:
+        """Resolves forward references of pending models once no referenced model is
+        still being built, in a single batch sharing one namespace.
+        """
+        if (
+            self._building_models
+            or self._recursive_inline_schemas
+            or not self._models_to_rebuild
+        ):
+            return
+        namespace = {m.__name__: m for m in self._models_to_rebuild}
+        for m in self._models_to_rebuild:
+            m.model_rebuild(_types_namespace=namespace)
+        self._models_to_rebuild.clear()
+
     def _create_array_root_model(
         self,
         schema: Dict[str, Any],
@@ -407,8 +728,7 @@ class PydanticModelBuilder(IModelBuilder[T]):
         """
         # Get the title for the model
         if original_ref and "title" not in schema:
-            ref_parts = original_ref.split("/")
-            title = ref_parts[-1] if ref_parts else "DynamicModel"
+            title = self._get_ref_title(original_ref)
         else:
             title = schema.get("title", "DynamicModel")
 
@@ -421,9 +741,7 @@ class PydanticModelBuilder(IModelBuilder[T]):
             if allow_undefined_array_items:
                 item_type = Any
             else:
-                from .exceptions import TypeError
-
-                raise TypeError("Array type must specify 'items' schema")
+                raise SchemaTypeError("Array type must specify 'items' schema")
         else:
             item_type = self._get_field_type(
                 items_schema, root_schema, allow_undefined_array_items
@@ -431,19 +749,15 @@ class PydanticModelBuilder(IModelBuilder[T]):
 
         # Determine if we need to use Set or List
         if schema.get("uniqueItems", False):
-            array_type = Set[item_type]
+            array_type = self.type_resolver.get_container_type(Set, item_type)
         else:
-            array_type = List[item_type]
+            array_type = self.type_resolver.get_container_type(List, item_type)
 
         # Build constraints for the array
         constraints = self.constraint_builder.build_constraints(schema)
 
         # Extract model-level json_schema_extra (non-standard properties)
-        model_extra = {
-            key: value
-            for key, value in schema.items()
-            if key not in self.STANDARD_MODEL_PROPERTIES
-        }
+        model_extra = self._get_schema_extra(schema, self.STANDARD_MODEL_PROPERTIES)
 
         # Create the RootModel class dynamically
         # RootModel requires the type to be specified as a generic parameter
@@ -454,9 +768,10 @@ class PydanticModelBuilder(IModelBuilder[T]):
         if description:
             namespace["__doc__"] = description
 
-        # Add model_config if we have extra properties
+        # Add model_config if we have extra properties; ConfigDict is a TypedDict,
+        # so a dict literal is the same config without the constructor call
         if model_extra:
-            namespace["model_config"] = ConfigDict(json_schema_extra=model_extra)
+            namespace["model_config"] = {"json_schema_extra": model_extra}
 
         # Apply constraints to the root field using Annotated
         if constraints:
@@ -472,15 +787,11 @@ class PydanticModelBuilder(IModelBuilder[T]):
         # Cache the model if it was referenced
         if original_ref:
             self._model_cache[original_ref] = model
-            # Mark model for rebuild if needed
+        # Mark model for rebuild if needed
+        if original_ref or not model.__pydantic_complete__:
             self._models_to_rebuild.add(model)
 
-        # Rebuild models if this is the top-level call
-        if not self._building_models and self._models_to_rebuild:
-            namespace = {m.__name__: m for m in self._models_to_rebuild}
-            for m in self._models_to_rebuild:
-                m.model_rebuild(_types_namespace=namespace)
-            self._models_to_rebuild.clear()
+        self._rebuild_pending_models()
 
         return model
 
@@ -509,8 +820,7 @@ class PydanticModelBuilder(IModelBuilder[T]):
         """
         # Get the title for the model
         if original_ref and "title" not in schema:
-            ref_parts = original_ref.split("/")
-            title = ref_parts[-1] if ref_parts else "DynamicModel"
+            title = self._get_ref_title(original_ref)
         else:
             title = schema.get("title", "DynamicModel")
 
@@ -525,11 +835,7 @@ class PydanticModelBuilder(IModelBuilder[T]):
         constraints = self.constraint_builder.build_constraints(schema)
 
         # Extract model-level json_schema_extra
-        model_extra = {
-            key: value
-            for key, value in schema.items()
-            if key not in self.STANDARD_MODEL_PROPERTIES
-        }
+        model_extra = self._get_schema_extra(schema, self.STANDARD_MODEL_PROPERTIES)
 
         # Build the class namespace
         namespace = {}
@@ -537,7 +843,7 @@ class PydanticModelBuilder(IModelBuilder[T]):
             namespace["__doc__"] = description
 
         if model_extra:
-            namespace["model_config"] = ConfigDict(json_schema_extra=model_extra)
+            namespace["model_config"] = {"json_schema_extra": model_extra}
 
         # Apply constraints using Annotated if needed
         if isinstance(constraints, dict) and constraints:
@@ -551,13 +857,10 @@ class PydanticModelBuilder(IModelBuilder[T]):
 
         if original_ref:
             self._model_cache[original_ref] = model
+        if original_ref or not model.__pydantic_complete__:
             self._models_to_rebuild.add(model)
 
-        if not self._building_models and self._models_to_rebuild:
-            ns = {m.__name__: m for m in self._models_to_rebuild}
-            for m in self._models_to_rebuild:
-                m.model_rebuild(_types_namespace=ns)
-            self._models_to_rebuild.clear()
+        self._rebuild_pending_models()
 
         return model
 
@@ -569,69 +872,132 @@ class PydanticModelBuilder(IModelBuilder[T]):
         allow_undefined_type: bool = False,
         populate_by_name: bool = False,
     ) -> Any:
-        """Resolves the Python type for a field schema."""
-        # Store the original ref if present
-        original_ref = field_schema.get("$ref")
-
-        if "$ref" in field_schema:
-            if original_ref in self._ref_type_cache:
-                return self._ref_type_cache[original_ref]
-
-            # Check if this reference is already being built (recursive reference)
-            if original_ref in self._building_models:
-                # Return cached model if available
-                if original_ref in self._model_cache:
-                    return self._model_cache[original_ref]
-                # Otherwise, return a forward reference (string)
-                # Extract model name from ref
-                ref_parts = original_ref.split("/")
-                model_name = ref_parts[-1] if ref_parts else "DynamicModel"
-                return model_name
-
-            # Check if we've already built this model
-            if original_ref in self._model_cache:
-                return self._model_cache[original_ref]
+        """Resolves the Python type for a field schema, memoizing compound schemas."""
+        # Plain scalar fields, the bulk of most schemas, go straight to the type resolver
+        if (
+            isinstance(field_schema, dict)
+            and "$ref" not in field_schema
+            and COMPOUND_SCHEMA_KEYS.isdisjoint(field_schema)
+            and field_schema.get("type") != "array"
+        ):
+            return intern_type(
+                self.type_resolver.resolve_type(
+                    schema=field_schema,
+                    root_schema=root_schema,
+                    allow_undefined_array_items=allow_undefined_array_items,
+                    allow_undefined_type=allow_undefined_type,
+                )
+            )
 
-            # Mark this ref as being built before resolving
-            self._building_models.add(original_ref)
+        cache_key = None
+        # Only compound schemas are worth hashing; references are resolved each time
+        # because their result depends on which models are still being built.
+        if isinstance(field_schema, dict) and not COMPOUND_SCHEMA_KEYS.isdisjoint(field_schema):
+            # Shares the per-call digests of the model cache, so nested fields are not
+            # serialised again at every level
+            schema_digest = self._get_schema_digest(field_schema)
+            if schema_digest is not None and not schema_digest[1]:
+                cache_key = (
+                    schema_digest[0],
+                    allow_undefined_array_items,
+                    allow_undefined_type,
+                    populate_by_name,
+                )
+                if cache_key in self._field_type_cache:
+                    return self._field_type_cache[cache_key]
+
+        field_type = self._resolve_field_type(
+            field_schema,
+            root_schema,
+            allow_undefined_array_items,
+            allow_undefined_type,
+            populate_by_name,
+        )
 
-            field_schema = self.reference_resolver.resolve_ref(
-                field_schema["$ref"], field_schema, root_schema
-            )
+        if cache_key is not None:
+            self._field_type_cache[cache_key] = field_type
+        return field_type
 
-        # Handle combiners
-        if "allOf" in field_schema:
-            return self.combiner_handler.handle_all_of(
-                field_schema["allOf"],
+    def _resolve_field_type(
+        self,
+        field_schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+    ) -> Any:
+        """Resolves the Python type for a field schema without memoization."""
+        if "$ref" not in field_schema:
+            return self._resolve_schema_type(
+                field_schema,
                 root_schema,
                 allow_undefined_array_items,
                 allow_undefined_type,
+                populate_by_name,
+                None,
             )
-        if "anyOf" in field_schema:
-            return self.combiner_handler.handle_any_of(
-                field_schema["anyOf"],
+
+        original_ref = field_schema["$ref"]
+        if original_ref in self._ref_type_cache:
+            return self._ref_type_cache[original_ref]
+
+        # Check if this reference is already being built (recursive reference)
+        if original_ref in self._building_models:
+            # Return cached model if available
+            if original_ref in self._model_cache:
+                return self._model_cache[original_ref]
+            # Otherwise, return a forward reference (string) named after the ref
+            return self._get_ref_title(original_ref)
+
+        # Check if we've already built this model
+        if original_ref in self._model_cache:
+            return self._model_cache[original_ref]
+
+        # Mark this ref as being built while its target is resolved
+        self._building_models.add(original_ref)
+        try:
+            return self._resolve_schema_type(
+                self.reference_resolver.resolve_ref(original_ref, field_schema, root_schema),
                 root_schema,
                 allow_undefined_array_items,
                 allow_undefined_type,
+                populate_by_name,
+                original_ref,
             )
-        if "oneOf" in field_schema:
-            return self.combiner_handler.handle_one_of(
-                field_schema["oneOf"],
+        finally:
+            # Only object targets are cached by ref; other targets (enums, scalars,
+            # arrays, combiners) are resolved again by later uses of the ref
+            self._building_models.discard(original_ref)
+
+    def _resolve_schema_type(
+        self,
+        field_schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+        original_ref: Optional[str],
+    ) -> Any:
+        """Resolves the Python type for a field schema whose $ref, if any, is resolved."""
+        # Handle combiners
+        if not COMBINER_KEYS.isdisjoint(field_schema):
+            return self._handle_combiner(
+                field_schema,
                 root_schema,
                 allow_undefined_array_items,
                 allow_undefined_type,
+                populate_by_name,
             )
 
         # Handle arrays by recursively processing items
-        if field_schema.get("type") == "array":
+        schema_type = field_schema.get("type")
+        if schema_type == "array":
             items_schema = field_schema.get("items")
             if not items_schema:
                 if allow_undefined_array_items:
                     return List[Any]
                 else:
-                    from .exceptions import TypeError
-
-                    raise TypeError("Array type must specify 'items' schema")
+                    raise SchemaTypeError("Array type must specify 'items' schema")
 
             # Recursively process the items schema through the model builder
             # This ensures that object types get proper models created
@@ -644,11 +1010,17 @@ class PydanticModelBuilder(IModelBuilder[T]):
             )
 
             if field_schema.get("uniqueItems", False):
-                return Set[item_type]
-            return List[item_type]
+                return self.type_resolver.get_container_type(Set, item_type)
+            return self.type_resolver.get_container_type(List, item_type)
 
         # Handle nested objects by recursively creating models
-        if field_schema.get("type") == "object" and "properties" in field_schema:
+        if schema_type == "object" and "properties" in field_schema:
+            # A cyclic inline schema already being built becomes a forward reference;
+            # schemas reached through a $ref are tracked by their ref instead
+            if original_ref is None and id(field_schema) in self._inline_models_in_progress:
+                self._recursive_inline_schemas.add(id(field_schema))
+                return self._inline_models_in_progress[id(field_schema)]
+
             # Build the model and cache/cleanup if we tracked this ref
             # Pass the original ref so the model can be named correctly
             model = self.create_pydantic_model(
@@ -669,30 +1041,55 @@ class PydanticModelBuilder(IModelBuilder[T]):
 
             return model
 
-        return self.type_resolver.resolve_type(
-            schema=field_schema,
-            root_schema=root_schema,
-            allow_undefined_array_items=allow_undefined_array_items,
-            allow_undefined_type=allow_undefined_type,
+        return intern_type(
+            self.type_resolver.resolve_type(
+                schema=field_schema,
+                root_schema=root_schema,
+                allow_undefined_array_items=allow_undefined_array_items,
+                allow_undefined_type=allow_undefined_type,
+            )
         )
 
+    def _handle_combiner(
+        self,
+        schema: Dict[str, Any],
+        root_schema: Dict[str, Any],
+        allow_undefined_array_items: bool,
+        allow_undefined_type: bool,
+        populate_by_name: bool,
+    ) -> Any:
+        """Builds the type of the first combiner (allOf, anyOf, oneOf) in a schema."""
+        for keyword, handler_name in COMBINER_HANDLERS.items():
+            if keyword in schema:
+                handle = getattr(self.combiner_handler, handler_name)
+                return handle(
+                    schema[keyword],
+                    root_schema,
+                    allow_undefined_array_items,
+                    allow_undefined_type,
+                    populate_by_name,
+                )
+        raise SchemaError("Schema has no allOf, anyOf or oneOf combiner")
+
     def _build_field_info(
         self,
         field_schema: Dict[str, Any],
         required: bool,
         alias: Optional[str] = None,
-    ) -> Field:
+    ) -> Any:
         """Creates a Pydantic Field with constraints from schema.
         If the field_name is invalid as a model field name, it adds the original name as an alias.
+        Plain fields get a bare default (``...`` or ``None``) instead of a Field instance.
         """
         field_kwargs = {}
 
-        # Add constraints
-        constraints = self.constraint_builder.build_constraints(field_schema)
-        if isinstance(constraints, type):
-            pass  # Type will be handled by type_resolver
-        elif isinstance(constraints, dict):
-            field_kwargs.update(constraints)
+        # Add constraints, skipping the builder for plain fields
+        if not CONSTRAINT_KEYS.isdisjoint(field_schema):
+            constraints = self.constraint_builder.build_constraints(field_schema)
+            if isinstance(constraints, type):
+                pass  # Type will be handled by type_resolver
+            elif isinstance(constraints, dict):
+                field_kwargs.update(constraints)
 
         # Handle description
         if "description" in field_schema:
@@ -709,19 +1106,23 @@ class PydanticModelBuilder(IModelBuilder[T]):
             field_kwargs["alias"] = alias
 
         # Extract field-level json_schema_extra
-        field_extra = {
-            key: value
-            for key, value in field_schema.items()
-            if key not in self.STANDARD_FIELD_PROPERTIES
-        }
+        field_extra = self._get_schema_extra(field_schema, self.STANDARD_FIELD_PROPERTIES)
 
         if field_extra:
             field_kwargs["json_schema_extra"] = field_extra
 
+        # Skip the FieldInfo construction when there is nothing but a default
+        if not field_kwargs:
+            return ...
+        if field_kwargs.keys() == {"default"}:
+            return field_kwargs["default"]
+
         return Field(**field_kwargs)
 
     @staticmethod
-    def _sanitize_field_name(field_name: str, invalid_names: set) -> tuple[str, Optional[str]]:
+    def _sanitize_field_name(
+        field_name: str, invalid_names: AbstractSet[str]
+    ) -> tuple[str, Optional[str]]:
         """Sanitizes field names to be valid Pydantic field names.
         Returns the sanitized field name and an optional alias if the name was changed.
         """
@@ -1,16 +1,109 @@
+import weakref
+from functools import lru_cache
 from datetime import date, datetime, time
-from typing import Any, List, Literal, Optional, Set, Union
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID
 
 from pydantic import AnyUrl
 
-from .exceptions import ReferenceError, TypeError
+from .exceptions import ReferenceError
+from .exceptions import TypeError as SchemaTypeError
 from .interfaces import IReferenceResolver, ITypeResolver
 
+# String formats with a dedicated Python type
+FORMAT_TYPE_MAP = {
+    "date-time": datetime,
+    "date": date,
+    "time": time,
+    "email": str,
+    "uri": AnyUrl,
+    "uuid": UUID,
+}
+
+PRIMITIVE_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": dict,  # Will be replaced with actual model in builder
+    "anyType": Any,
+}
+
+# Parameterized annotations shared between fields and builders, keyed by structure.
+# typing's own cache is bounded and compares Union/Literal args as unordered sets.
+_interned_types: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
+
+
+def _type_key(annotation: Any) -> Hashable:
+    args = get_args(annotation)
+    if not args:
+        return type(annotation), annotation
+    return type(annotation), get_origin(annotation), tuple(_type_key(arg) for arg in args)
+
+
+def intern_type(annotation: Any) -> Any:
+    """Returns the shared instance of a parameterized annotation such as List[int]."""
+    if not get_args(annotation):
+        return annotation
+    try:
+        return _interned_types.setdefault(_type_key(annotation), annotation)
+    except TypeError:
+        # Unhashable arguments or annotations that cannot be weakly referenced
+        return annotation
+
+
+@lru_cache(maxsize=1024)
+def split_ref(ref: str) -> Tuple[str, ...]:
+    """Splits a local JSON Pointer ref into its unescaped path segments."""
+    return tuple(part.replace("~1", "/").replace("~0", "~") for part in ref.split("/")[1:])
+
 
 class TypeResolver(ITypeResolver):
     """Resolves JSON Schema types to Pydantic types"""
 
+    def __init__(self, reference_resolver: Optional[IReferenceResolver] = None):
+        # A shared resolver reuses its resolved refs; without one, each call resolves afresh
+        self.reference_resolver = reference_resolver
+        # Literal specializations keyed by typed enum or const values, since 1 == True
+        self._literal_cache: Dict[Tuple[Tuple[type, Any], ...], Any] = {}
+        # List/Set annotations keyed by container and item type identity; the item
+        # type is kept to detect id reuse
+        self._container_cache: Dict[Tuple[Any, int], Tuple[Any, Any]] = {}
+
+    def _get_literal(self, values: List[Any]) -> Any:
+        """Returns Literal[values], reusing the specialization for repeated enums and consts."""
+        key = tuple((type(value), value) for value in values)
+        try:
+            return self._literal_cache[key]
+        except KeyError:
+            literal_type = self._literal_cache[key] = Literal[tuple(values)]
+            return literal_type
+        except TypeError:
+            # Unhashable values cannot be cached
+            return Literal[tuple(values)]
+
+    def get_container_type(self, container: Any, item_type: Any) -> Any:
+        """Returns container[item_type], reusing it for array fields with the same items."""
+        key = (container, id(item_type))
+        cached = self._container_cache.get(key)
+        if cached is not None and cached[0] is item_type:
+            return cached[1]
+        container_type = intern_type(container[item_type])
+        self._container_cache[key] = (item_type, container_type)
+        return container_type
+
     def resolve_type(
         self,
         schema: dict,
@@ -21,24 +114,34 @@ class TypeResolver(ITypeResolver):
     ) -> Any:
         """Get the Pydantic field type for a JSON schema field."""
         if not isinstance(schema, dict):
-            raise TypeError(f"Invalid schema: expected dict, got {type(schema)}")
+            raise SchemaTypeError(f"Invalid schema: expected dict, got {type(schema)}")
 
         # Handle references first
         if "$ref" in schema:
-            reference_resolver = ReferenceResolver()
+            reference_resolver = self.reference_resolver or ReferenceResolver()
             schema = reference_resolver.resolve_ref(schema["$ref"], schema, root_schema)
 
         if "const" in schema:
             if schema["const"] is None:
                 return type(None)
-            return Literal[schema["const"]]
+            return self._get_literal([schema["const"]])
 
-        if schema.get("type") == "null":
+        schema_type = schema.get("type")
+        if schema_type == "null":
             return type(None)
 
+        # Plain primitives, the most common fields, resolve with a single lookup
+        if (
+            isinstance(schema_type, str)
+            and schema_type in PRIMITIVE_TYPE_MAP
+            and "enum" not in schema
+            and not (schema_type == "string" and "format" in schema)
+        ):
+            return PRIMITIVE_TYPE_MAP[schema_type]
+
         # Handle array of types (e.g. ["string", "null"])
-        if isinstance(schema.get("type"), list):
-            types = schema["type"]
+        if isinstance(schema_type, list):
+            types = schema_type
             if "null" in types:
                 other_types = [t for t in types if t != "null"]
                 if len(other_types) == 0:
@@ -90,11 +193,10 @@ class TypeResolver(ITypeResolver):
 
         if "enum" in schema:
             if not schema["enum"]:
-                raise TypeError("Enum must have at least one value")
-            return Literal[tuple(schema["enum"])]
+                raise SchemaTypeError("Enum must have at least one value")
+            return self._get_literal(schema["enum"])
 
         # Infer type if not explicitly specified
-        schema_type = schema.get("type")
         if not schema_type:
             # Infer type based on schema structure
             if "properties" in schema:
@@ -104,7 +206,7 @@ class TypeResolver(ITypeResolver):
             elif allow_undefined_type:
                 schema_type = "anyType"
             else:
-                raise TypeError("Schema must specify a type. Set allow_undefined_type=True to infer Any type for schemas without explicit types.")
+                raise SchemaTypeError("Schema must specify a type. Set allow_undefined_type=True to infer Any type for schemas without explicit types.")
 
         if schema_type == "array":
             items_schema = schema.get("items")
@@ -112,12 +214,12 @@ class TypeResolver(ITypeResolver):
                 if allow_undefined_array_items:
                     return List[Any]  # Allow any type if items are not defined
                 else:
-                    raise TypeError("Array type must specify 'items' schema")
+                    raise SchemaTypeError("Array type must specify 'items' schema")
 
             # Handle references in array items
             if isinstance(items_schema, dict) and "$ref" in items_schema:
                 # We need to resolve the reference before proceeding
-                reference_resolver = ReferenceResolver()
+                reference_resolver = self.reference_resolver or ReferenceResolver()
                 items_schema = reference_resolver.resolve_ref(
                     items_schema["$ref"], items_schema, root_schema
                 )
@@ -129,69 +231,68 @@ class TypeResolver(ITypeResolver):
                 allow_undefined_type=allow_undefined_type,
             )
             if schema.get("uniqueItems", False):
-                return Set[item_type]
-            return List[item_type]
+                return self.get_container_type(Set, item_type)
+            return self.get_container_type(List, item_type)
 
         # Handle format for string types
         if schema_type == "string" and "format" in schema:
-            format_type = schema["format"]
-            format_map = {
-                "date-time": datetime,
-                "date": date,
-                "time": time,
-                "email": str,
-                "uri": AnyUrl,
-                "uuid": UUID,
-            }
-            return format_map.get(format_type, str)
-
-        if schema_type == "anyType":
-            return Any
-
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "object": dict,  # Will be replaced with actual model in builder
-        }
-
-        return type_map.get(schema_type, str)
+            return FORMAT_TYPE_MAP.get(schema["format"], str)
+
+        return PRIMITIVE_TYPE_MAP.get(schema_type, str)
 
 
 class ReferenceResolver(IReferenceResolver):
     """Resolves JSON Schema references"""
 
-    def __init__(self):
-        self._processing_refs: Set[str] = set()
+    def __init__(self, cache_refs: bool = False):
+        # Opt-in, since cached roots stay alive and mutations to them go unseen until
+        # clear_cache(); the model builder clears it after every top-level call
+        self.cache_refs = cache_refs
+        # Resolved targets keyed by root id and ref; the root is kept to detect id reuse
+        self._resolved_refs: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget resolved references, e.g. when root schemas may have changed."""
+        self._resolved_refs.clear()
+
+    def resolve_ref(
+        self,
+        ref: str,
+        schema: dict,
+        root_schema: dict,
+        _processing_refs: Tuple[str, ...] = (),
+    ) -> Any:
+        """Resolve a JSON Schema $ref.
 
-    def resolve_ref(self, ref: str, schema: dict, root_schema: dict) -> Any:
-        """Resolve a JSON Schema $ref."""
+        ``_processing_refs`` holds the refs followed so far on a ref-to-ref chain, so
+        cycle detection keeps no state on the resolver.
+        """
         if not ref.startswith("#"):
             raise ReferenceError("Only local references (#/...) are supported")
 
-        if ref in self._processing_refs:
+        cache_key = (id(root_schema), ref)
+        if self.cache_refs:
+            cached = self._resolved_refs.get(cache_key)
+            if cached is not None and cached[0] is root_schema:
+                return cached[1]
+
+        if ref in _processing_refs:
             raise ReferenceError(f"Circular reference detected: {ref}")
 
-        self._processing_refs.add(ref)
-        try:
-            # Split the reference path and navigate through the schema
-            path = ref.split("/")[1:]  # Remove the '#' and split
-            current = root_schema
-
-            # Navigate through the schema
-            for part in path:
-                # Handle JSON Pointer escaping
-                part = part.replace("~1", "/").replace("~0", "~")
-                try:
-                    current = current[part]
-                except KeyError:
-                    raise ReferenceError(f"Invalid reference path: {ref}")
-
-            # If we find another reference, resolve it
-            if isinstance(current, dict) and "$ref" in current:
-                current = self.resolve_ref(current["$ref"], current, root_schema)
-
-            return current
-        finally:
-            self._processing_refs.remove(ref)
+        # Navigate through the schema along the unescaped pointer segments
+        current = root_schema
+        for part in split_ref(ref):
+            try:
+                current = current[part]
+            except KeyError:
+                raise ReferenceError(f"Invalid reference path: {ref}")
+
+        # If we find another reference, resolve it
+        if isinstance(current, dict) and "$ref" in current:
+            current = self.resolve_ref(
+                current["$ref"], current, root_schema, _processing_refs + (ref,)
+            )
+
+        if self.cache_refs:
+            self._resolved_refs[cache_key] = (root_schema, current)
+        return current
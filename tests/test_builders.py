@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from typing import Literal
 from uuid import UUID
@@ -120,6 +121,26 @@ def test_merge_numeric_constraints():
     assert merged["maximum"] == 50  # Takes the more restrictive maximum
 
 
+def test_merge_multiple_of_constraints():
+    """Test that multipleOf merges to the least common multiple."""
+    builder = ConstraintBuilder()
+
+    assert builder.merge_constraints({"multipleOf": 4}, {"multipleOf": 6})["multipleOf"] == 12
+    assert builder.merge_constraints({"multipleOf": 0.5}, {"multipleOf": 0.2})["multipleOf"] == 1.0
+    assert builder.merge_constraints({}, {"multipleOf": 3})["multipleOf"] == 3
+
+
+def test_merge_array_constraints():
+    """Test merging array length constraints."""
+    builder = ConstraintBuilder()
+
+    merged = builder.merge_constraints(
+        {"minItems": 1, "maxItems": 10}, {"minItems": 2, "maxItems": 5}
+    )
+    assert merged["minItems"] == 2
+    assert merged["maxItems"] == 5
+
+
 def test_merge_string_constraints():
     """Test merging string constraints."""
     builder = ConstraintBuilder()
@@ -130,7 +151,12 @@ def test_merge_string_constraints():
     merged = builder.merge_constraints(schema1, schema2)
     assert merged["minLength"] == 5
     assert merged["maxLength"] == 8
-    assert "(?=^[A-Z])(?=[0-9]$)" in merged["pattern"]
+    # Each pattern must match somewhere in the string, not at the same position
+    merged_pattern = re.compile(merged["pattern"])
+    assert merged_pattern.search("A12")
+    assert merged_pattern.search("Ab\n9")
+    assert not merged_pattern.search("a12")
+    assert not merged_pattern.search("A1b")
 
 
 def test_merge_mixed_constraints():
@@ -156,3 +182,16 @@ def test_merge_with_empty_schema():
 
     merged = builder.merge_constraints(schema1, schema2)
     assert merged["minimum"] == 0
+
+
+def test_lookaround_patterns_are_precompiled_once():
+    """Test that patterns needing Python's regex engine are compiled and shared."""
+    builder = ConstraintBuilder()
+
+    plain = builder.build_constraints({"pattern": "^[A-Z]+$"})
+    assert plain["pattern"] == "^[A-Z]+$"
+
+    first = builder.build_constraints({"pattern": "(?=^a)(?=^ab)"})
+    second = builder.build_constraints({"type": "string", "pattern": "(?=^a)(?=^ab)"})
+    assert isinstance(first["pattern"], re.Pattern)
+    assert first["pattern"] is second["pattern"]
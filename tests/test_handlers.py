@@ -927,3 +927,112 @@ def test_any_of_populate_by_name():
     assert len(types) == 2
     assert types[0].model_config["populate_by_name"] is True
     assert types[1].model_config["populate_by_name"] is True
+
+
+def test_one_of_does_not_mutate_input_schemas():
+    """Test that oneOf handling leaves the caller's schemas untouched."""
+    import copy
+
+    handler = create_handler()
+    root_schema = {
+        "$defs": {
+            "Cat": {
+                "type": "object",
+                "properties": {"type": {"const": "cat"}, "meow": {"type": "boolean"}},
+            }
+        }
+    }
+    schemas = [
+        {
+            "type": "object",
+            "properties": {"type": {"const": "dog"}, "bark": {"type": "boolean"}},
+            "required": ["bark"],
+        },
+        {"$ref": "#/$defs/Cat"},
+    ]
+    original_schemas = copy.deepcopy(schemas)
+    original_root = copy.deepcopy(root_schema)
+
+    handler.handle_one_of(schemas, root_schema)
+
+    assert schemas == original_schemas
+    assert root_schema == original_root
+
+
+def test_one_of_enum_and_const_union():
+    """Test oneOf mixing enum and const variants creates a single Literal type."""
+    from typing import Literal, get_args, get_origin
+
+    handler = create_handler()
+
+    literal_type = handler.handle_one_of(
+        [{"type": "string", "enum": ["red", "green"]}, {"const": "blue"}], {}
+    )
+    assert get_args(literal_type) == ("red", "green", "blue")
+
+    # Overlapping enum values must still be validated as exactly-one
+    overlapping = handler.handle_one_of([{"enum": ["red", "green"]}, {"enum": ["green"]}], {})
+    assert get_origin(overlapping) is Union
+    assert get_args(overlapping) == (Literal["red", "green"], Literal["green"])
+
+
+def test_all_of_with_merged_patterns():
+    """Test that allOf pattern merging produces a model pydantic can build."""
+    handler = create_handler()
+    schemas = [
+        {"type": "object", "properties": {"code": {"type": "string", "pattern": "^A"}}},
+        {"type": "object", "properties": {"code": {"type": "string", "pattern": "^AB"}}},
+    ]
+
+    model = handler.handle_all_of(schemas, {})
+
+    assert model(code="ABC").code == "ABC"
+    with pytest.raises(ValueError):
+        model(code="ACB")
+
+
+def test_one_of_ref_variants_are_shared():
+    """Test that a $ref variant used by several oneOfs is built once per root schema."""
+    handler = create_handler()
+    root_schema = {
+        "$defs": {
+            "Cat": {
+                "type": "object",
+                "properties": {"type": {"const": "cat"}, "lives": {"type": "integer"}},
+            },
+            "Dog": {
+                "type": "object",
+                "properties": {"type": {"const": "dog"}, "name": {"type": "string"}},
+            },
+        },
+    }
+    variants = [{"$ref": "#/$defs/Cat"}, {"$ref": "#/$defs/Dog"}]
+
+    first = handler.handle_one_of(variants, root_schema)
+    second = handler.handle_one_of(list(reversed(variants)), root_schema)
+
+    first_models = {type(first(root={"type": t}).root) for t in ("cat", "dog")}
+    second_models = {type(second(root={"type": t}).root) for t in ("cat", "dog")}
+    assert first_models == second_models
+
+    handler.clear_cache()
+    third = handler.handle_one_of(variants, root_schema)
+    assert type(third(root={"type": "cat"}).root) not in first_models
+
+
+def test_one_of_variant_models_defer_their_own_build():
+    """Test that deferred variant models still validate through the union and directly."""
+    handler = create_handler()
+    schemas = [
+        {"type": "object", "properties": {"type": {"const": "cat"}, "lives": {"type": "integer"}}},
+        {"type": "object", "properties": {"type": {"const": "dog"}, "name": {"type": "string"}}},
+    ]
+
+    union_model = handler.handle_one_of(schemas, {})
+    cat_model = type(union_model(root={"type": "cat", "lives": 9}).root)
+
+    assert cat_model.model_config["defer_build"] is True
+    assert cat_model(lives=3).lives == 3
+    with pytest.raises(ValueError):
+        cat_model(lives=3, name="Tom")
+    assert "cat" in str(union_model.model_json_schema())
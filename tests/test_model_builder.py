@@ -717,3 +717,325 @@ def test_model_with_all_of_combiner_with_underscore_property():
     instance = model(combined_field={"_name": "Alice", "age": 30})
     assert instance.combined_field.name == "Alice"
     assert instance.combined_field.age == 30
+
+
+def test_identical_nested_schemas_share_model():
+    """Test that structurally identical nested object schemas are only built once."""
+    builder = PydanticModelBuilder()
+    address = {
+        "type": "object",
+        "title": "Address",
+        "properties": {"street": {"type": "string"}},
+    }
+    schema = {
+        "type": "object",
+        "properties": {"home": dict(address), "work": dict(address)},
+    }
+
+    model = builder.create_pydantic_model(schema)
+
+    home_type = model.model_fields["home"].annotation
+    work_type = model.model_fields["work"].annotation
+    assert home_type is work_type
+    assert builder.create_pydantic_model(schema) is model
+
+
+def test_model_cache_respects_build_options():
+    """Test that memoized models are keyed on the build options as well as the schema."""
+    builder = PydanticModelBuilder()
+    schema = {"type": "object", "properties": {"_name": {"type": "string"}}}
+
+    by_alias = builder.create_pydantic_model(schema)
+    by_name = builder.create_pydantic_model(schema, populate_by_name=True)
+
+    assert by_alias is not by_name
+    assert by_name(name="Alice").name == "Alice"
+
+
+def test_deeply_nested_objects_are_built_bottom_up():
+    """Test that nested object schemas are collected children first and reused."""
+    builder = PydanticModelBuilder()
+    leaf = {"type": "object", "title": "Leaf", "properties": {"value": {"type": "integer"}}}
+    schema = leaf
+    for _ in range(40):
+        schema = {"type": "object", "properties": {"child": schema}}
+
+    nested = builder._collect_nested_object_schemas(schema)
+    assert nested[0] is leaf
+    assert len(nested) == 40
+
+    model = builder.create_pydantic_model(schema)
+    # The recursive build finds every model the bottom-up pass cached under the same key
+    assert len(builder._schema_model_cache) == 41
+    data = {"value": 1}
+    for _ in range(40):
+        data = {"child": data}
+    instance = model(**data)
+
+    node = instance
+    for _ in range(40):
+        node = node.child
+    assert node.value == 1
+    assert type(node) is builder.create_pydantic_model(leaf)
+
+
+def test_deeply_nested_schemas_are_digested_once_per_object(monkeypatch):
+    """Test that cache keys hash every schema object once, however deep it is nested."""
+    from json_schema_to_pydantic import model_builder
+
+    schema = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    for level in range(40):
+        schema = {
+            "type": "object",
+            "properties": {
+                "child": schema,
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "label": {"type": "string", "description": f"level {level}"},
+            },
+        }
+
+    def count_objects(value):
+        if isinstance(value, dict):
+            return 1 + sum(count_objects(item) for item in value.values())
+        return 0
+
+    digested = []
+    digest = model_builder._digest
+    monkeypatch.setattr(
+        model_builder, "_digest", lambda encoded: digested.append(encoded) or digest(encoded)
+    )
+
+    model = PydanticModelBuilder().create_pydantic_model(schema)
+
+    assert len(digested) <= count_objects(schema)
+    assert model.model_validate({"child": {"label": "x"}}).child.label == "x"
+
+
+def test_field_infos_are_not_shared_between_fields():
+    """Test that identical field schemas get independent FieldInfo instances.
+
+    Pydantic mutates the FieldInfo passed as a default (it appends Annotated metadata
+    in place), so sharing one between fields would leak constraints across them.
+    """
+    from typing import Annotated
+
+    short_text = Annotated[str, Field(min_length=3)]
+    builder = PydanticModelBuilder(predefined_refs={"#/definitions/ShortText": short_text})
+    schema = {
+        "type": "object",
+        "properties": {
+            "text": {"$ref": "#/definitions/ShortText", "description": "Shared"},
+            "count": {"type": "integer", "description": "Shared"},
+        },
+        "definitions": {"ShortText": {"type": "string"}},
+    }
+
+    model = builder.create_pydantic_model(schema)
+
+    assert model.model_fields["count"].metadata == []
+    assert model(text="abcd", count=1).count == 1
+    with pytest.raises(ValidationError):
+        model(text="ab", count=1)
+
+
+def test_identical_combiner_fields_share_type():
+    """Test that field types of identical compound schemas are resolved once."""
+    builder = PydanticModelBuilder()
+    combined = {
+        "allOf": [
+            {"type": "object", "properties": {"name": {"type": "string"}}},
+            {"type": "object", "properties": {"age": {"type": "integer"}}},
+        ]
+    }
+    schema = {
+        "type": "object",
+        "properties": {"first": combined, "second": {**combined}},
+    }
+
+    model = builder.create_pydantic_model(schema)
+
+    assert model.model_fields["first"].annotation is model.model_fields["second"].annotation
+    instance = model(first={"name": "a", "age": 1}, second={"name": "b", "age": 2})
+    assert instance.second.age == 2
+
+
+def test_model_cache_sees_root_schema_mutations():
+    """Test that a root schema mutated between calls is not served a stale model."""
+    builder = PydanticModelBuilder()
+    schema = {
+        "type": "object",
+        "properties": {"item": {"allOf": [{"$ref": "#/definitions/Item"}]}},
+    }
+    root_schema = {
+        "definitions": {"Item": {"type": "object", "properties": {"a": {"type": "string"}}}}
+    }
+
+    first = builder.create_pydantic_model(schema, root_schema=root_schema)
+    root_schema["definitions"]["Item"]["properties"] = {"b": {"type": "integer"}}
+    second = builder.create_pydantic_model(schema, root_schema=root_schema)
+
+    assert second is not first
+    assert "b" in second.model_fields["item"].annotation.model_fields
+
+
+def test_any_of_refs_reuse_referenced_model():
+    """Test that anyOf variants referencing a definition share its model."""
+    builder = PydanticModelBuilder()
+    schema = {
+        "type": "object",
+        "properties": {
+            "pet": {"$ref": "#/definitions/Pet"},
+            "pet_or_name": {"anyOf": [{"$ref": "#/definitions/Pet"}, {"type": "string"}]},
+        },
+        "definitions": {
+            "Pet": {"type": "object", "properties": {"name": {"type": "string"}}},
+        },
+    }
+
+    model = builder.create_pydantic_model(schema)
+    instance = model(pet={"name": "Rex"}, pet_or_name={"name": "Tom"})
+
+    assert type(instance.pet_or_name) is type(instance.pet)
+    assert type(instance.pet).__name__ == "Pet"
+
+
+def test_any_of_refs_to_enum_definition_in_several_fields():
+    """Test that anyOf refs to a non-object definition resolve in every field."""
+    builder = PydanticModelBuilder()
+    schema = {
+        "type": "object",
+        "properties": {
+            "primary": {"anyOf": [{"$ref": "#/$defs/Color"}, {"type": "null"}]},
+            "secondary": {"anyOf": [{"$ref": "#/$defs/Color"}, {"type": "null"}]},
+        },
+        "$defs": {"Color": {"type": "string", "enum": ["r", "g"]}},
+    }
+
+    model = builder.create_pydantic_model(schema)
+    instance = model(primary="r", secondary="g")
+
+    assert instance.secondary == "g"
+    assert model.model_fields["secondary"].annotation == model.model_fields["primary"].annotation
+    assert not builder._building_models
+    with pytest.raises(ValidationError):
+        model(primary="r", secondary="b")
+
+
+def test_nested_combiner_fields_respect_populate_by_name():
+    """Test that combiner fields inside a model get the populate_by_name option."""
+    builder = PydanticModelBuilder()
+    schema = {
+        "type": "object",
+        "properties": {
+            "item": {
+                "allOf": [
+                    {"type": "object", "properties": {"_id": {"type": "string"}}},
+                    {"type": "object", "properties": {"name": {"type": "string"}}},
+                ]
+            }
+        },
+    }
+
+    model = builder.create_pydantic_model(schema, populate_by_name=True)
+    instance = model(item={"id": "abc", "name": "thing"})
+
+    assert instance.item.id == "abc"
+
+
+def test_model_cache_hits_for_equal_root_schemas_across_calls():
+    """Test that equal but distinct root schemas reuse models built by earlier calls."""
+    import copy
+
+    builder = PydanticModelBuilder()
+    root_schema = {
+        "definitions": {"Item": {"type": "object", "properties": {"a": {"type": "string"}}}}
+    }
+    schema = {"type": "object", "properties": {"item": {"$ref": "#/definitions/Item"}}}
+
+    first = builder.create_pydantic_model(schema, root_schema=root_schema)
+    second = builder.create_pydantic_model(
+        copy.deepcopy(schema), root_schema=copy.deepcopy(root_schema)
+    )
+
+    assert second is first
+
+
+def test_model_cache_keeps_non_json_defaults_apart():
+    """Test that a datetime default is not mistaken for its ISO string."""
+    from datetime import datetime
+
+    builder = PydanticModelBuilder()
+
+    def schema(default):
+        return {"type": "object", "properties": {"at": {"type": "string", "default": default}}}
+
+    first = builder.create_pydantic_model(schema(datetime(2020, 1, 1)))
+    second = builder.create_pydantic_model(schema("2020-01-01T00:00:00"))
+
+    assert second is not first
+    assert second.model_fields["at"].default == "2020-01-01T00:00:00"
+
+
+def test_json_schema_extra_model_has_no_intermediate_base():
+    """Test that models with json_schema_extra subclass the base model type directly."""
+
+    class CustomBase(BaseModel):
+        pass
+
+    builder = PydanticModelBuilder(base_model_type=CustomBase)
+    schema = {"type": "object", "x-owner": "team", "properties": {"a": {"type": "string"}}}
+
+    model = builder.create_pydantic_model(schema)
+
+    assert model.__bases__ == (CustomBase,)
+    assert model.model_json_schema()["x-owner"] == "team"
+
+
+def test_enum_with_unhashable_values():
+    """Test that enum fields with list values build and validate."""
+    builder = PydanticModelBuilder()
+    schema = {"type": "object", "properties": {"a": {"enum": [[1, 2], "x"]}}}
+
+    model = builder.create_pydantic_model(schema)
+    assert model(a=[1, 2]).a == [1, 2]
+    assert model(a="x").a == "x"
+    with pytest.raises(ValidationError):
+        model(a=[2, 1])
+
+
+def test_const_object_field():
+    """Test that a field with an object const builds and validates."""
+    builder = PydanticModelBuilder()
+    schema = {"type": "object", "properties": {"a": {"const": {"k": 1}}}}
+
+    model = builder.create_pydantic_model(schema)
+    assert model(a={"k": 1}).a == {"k": 1}
+    with pytest.raises(ValidationError):
+        model(a={"k": 2})
+
+
+def test_cached_nested_model_with_forward_reference_is_complete():
+    """Test that a cached nested model referring to a model being built is rebuilt."""
+    builder = PydanticModelBuilder()
+    root = {
+        "type": "object",
+        "properties": {"node": {"$ref": "#/definitions/Node"}},
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "child": {
+                        "type": "object",
+                        "properties": {"next": {"$ref": "#/definitions/Node"}},
+                    }
+                },
+            }
+        },
+    }
+    child = root["definitions"]["Node"]["properties"]["child"]
+
+    builder.create_pydantic_model(root)
+    model = builder.create_pydantic_model(child, root_schema=root)
+
+    assert model.__pydantic_complete__
+    assert model.model_validate({"next": {"child": {}}}).next.child.next is None
@@ -172,3 +172,75 @@ def test_multiple_recursive_definitions():
     assert len(instance.children) == 2
     assert instance.children[0].name == "Bob"
     assert instance.spouse.name == "David"
+
+
+def test_recursive_model_with_cyclic_inline_schema():
+    """Test inline schemas that refer back to themselves as Python objects.
+
+    Dereferencing tools can produce such cyclic dicts instead of $ref pointers.
+    """
+    builder = PydanticModelBuilder()
+    node = {
+        "type": "object",
+        "title": "Node",
+        "properties": {"value": {"type": "string"}},
+        "required": ["value"],
+    }
+    node["properties"]["children"] = {"type": "array", "items": node}
+    schema = {"type": "object", "properties": {"root": node}, "required": ["root"]}
+
+    model = builder.create_pydantic_model(schema)
+    instance = model(root={"value": "root", "children": [{"value": "child"}]})
+
+    assert instance.root.children[0].value == "child"
+    assert type(instance.root.children[0]) is type(instance.root)
+    assert instance.root.children[0].children is None
+
+
+def test_recursive_inline_schema_through_reference():
+    """Test an inline object whose $ref leads back to the definition containing it."""
+    builder = PydanticModelBuilder()
+    root = {
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "child": {
+                        "type": "object",
+                        "properties": {"next": {"$ref": "#/definitions/Node"}},
+                    }
+                },
+            }
+        }
+    }
+    child = root["definitions"]["Node"]["properties"]["child"]
+
+    model = builder.create_pydantic_model(child, root_schema=root)
+    instance = model.model_validate({"next": {"child": {"next": {"child": {}}}}})
+
+    assert type(instance.next.child) is model
+    assert instance.next.child.next.child.next is None
+
+
+def test_recursive_definition_built_directly():
+    """Test building a definition whose items $ref back to it, without a title."""
+    builder = PydanticModelBuilder()
+    root = {
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "items": {"type": "array", "items": {"$ref": "#/definitions/Node"}},
+                },
+            }
+        }
+    }
+
+    model = builder.create_pydantic_model(root["definitions"]["Node"], root_schema=root)
+    instance = model.model_validate({"items": [{"name": "a", "items": [{"name": "b"}]}]})
+
+    assert type(instance.items[0]).__name__ == "Node"
+    assert instance.items[0].items[0].name == "b"
+    assert not builder._building_models
+    assert not builder._models_to_rebuild
@@ -178,6 +178,59 @@ def test_type_resolver_enum():
     assert result == Literal["red", "green", "blue"]
 
 
+def test_type_resolver_enum_literal_is_cached():
+    """Test that repeated enums reuse the Literal type without mixing up 1 and True."""
+    resolver = TypeResolver()
+    from typing import get_args
+
+    first = resolver.resolve_type({"enum": [1, 2]}, {})
+    assert resolver.resolve_type({"enum": [1, 2]}, {}) is first
+
+    bool_literal = resolver.resolve_type({"enum": [True, 2]}, {})
+    assert get_args(bool_literal)[0] is True
+
+
+def test_type_resolver_enum_with_unhashable_values():
+    """Test that enums with list or dict values bypass the Literal cache."""
+    resolver = TypeResolver()
+    from typing import get_args
+
+    result = resolver.resolve_type({"enum": [[1, 2], "x"]}, {})
+    assert get_args(result) == ([1, 2], "x")
+
+
+def test_type_resolver_const_literal_is_cached():
+    """Test that repeated consts reuse the Literal type without mixing up 1 and True."""
+    resolver = TypeResolver()
+    from typing import get_args
+
+    first = resolver.resolve_type({"const": 1}, {})
+    assert resolver.resolve_type({"const": 1}, {}) is first
+    assert get_args(resolver.resolve_type({"const": True}, {}))[0] is True
+
+
+def test_type_resolver_const_object():
+    """Test that object and array consts bypass the Literal cache."""
+    resolver = TypeResolver()
+    from typing import get_args
+
+    assert get_args(resolver.resolve_type({"const": {"k": 1}}, {})) == ({"k": 1},)
+    assert get_args(resolver.resolve_type({"const": [1]}, {})) == ([1],)
+
+
+def test_type_resolver_array_types_are_cached():
+    """Test that arrays with the same items reuse their List and Set types."""
+    resolver = TypeResolver()
+    from typing import List, Set
+
+    items = {"type": "array", "items": {"enum": ["a", "b"]}}
+    first = resolver.resolve_type(items, {})
+    assert resolver.resolve_type(dict(items), {}) is first
+    assert first == List[resolver.resolve_type(items["items"], {})]
+    unique = resolver.resolve_type({**items, "uniqueItems": True}, {})
+    assert unique == Set[resolver.resolve_type(items["items"], {})]
+
+
 def test_type_resolver_const():
     """Test handling of const values."""
     resolver = TypeResolver()
@@ -536,3 +589,69 @@ def test_type_resolver_undefined_type():
     # Test with undefined type and allow_undefined_type=True
     result = resolver.resolve_type(schema, {}, allow_undefined_type=True)
     assert result is Any
+
+
+def test_intern_type_keeps_order_and_value_types():
+    """Test that interned annotations are only shared when structurally identical."""
+    from typing import List, Literal, Union, get_args
+
+    from json_schema_to_pydantic.resolvers import intern_type
+
+    int_or_str = intern_type(List[Union[int, str]])
+    assert intern_type(List[Union[int, str]]) is int_or_str
+    intern_type(Union[int, str])
+    assert get_args(intern_type(Union[str, int])) == (str, int)
+
+    assert get_args(intern_type(Literal[1]))[0] is not True
+    assert get_args(intern_type(Literal[True]))[0] is True
+    assert intern_type(str) is str
+
+
+def test_intern_type_returns_unhashable_annotations_as_is():
+    """Test that annotations with unhashable arguments are not interned."""
+    from typing import Annotated, List, Literal
+
+    from json_schema_to_pydantic.resolvers import intern_type
+
+    literal = Literal[[1], 2]
+    assert intern_type(literal) is literal
+    annotated_list = List[Annotated[str, {"k": 1}]]
+    assert intern_type(annotated_list) is annotated_list
+    assert TypeResolver().get_container_type(List, literal) == List[literal]
+
+
+def test_reference_resolver_caches_resolved_refs():
+    """Test that repeated refs are resolved once per root and escapes are decoded."""
+    from json_schema_to_pydantic.resolvers import split_ref
+
+    assert split_ref("#/definitions/a~1b~0c") == ("definitions", "a/b~c")
+
+    resolver = ReferenceResolver(cache_refs=True)
+    root_schema = {"definitions": {"a/b~c": {"type": "string"}}}
+    first = resolver.resolve_ref("#/definitions/a~1b~0c", {}, root_schema)
+    assert resolver.resolve_ref("#/definitions/a~1b~0c", {}, root_schema) is first
+
+    # Another root with the same ref resolves against its own content
+    other_root = {"definitions": {"a/b~c": {"type": "integer"}}}
+    assert resolver.resolve_ref("#/definitions/a~1b~0c", {}, other_root) == {"type": "integer"}
+
+
+def test_reference_resolver_does_not_cache_by_default():
+    """Test that a standalone resolver keeps no roots and sees in-place mutations."""
+    resolver = ReferenceResolver()
+    root_schema = {"definitions": {"Name": {"type": "string"}}}
+
+    assert resolver.resolve_ref("#/definitions/Name", {}, root_schema) == {"type": "string"}
+    root_schema["definitions"]["Name"] = {"type": "integer"}
+    assert resolver.resolve_ref("#/definitions/Name", {}, root_schema) == {"type": "integer"}
+    assert not resolver._resolved_refs
+
+
+def test_type_resolver_uses_shared_reference_resolver():
+    """Test that a TypeResolver resolves refs through an injected ReferenceResolver."""
+    reference_resolver = ReferenceResolver(cache_refs=True)
+    resolver = TypeResolver(reference_resolver=reference_resolver)
+    root_schema = {"definitions": {"Name": {"type": "string"}}}
+
+    assert resolver.resolve_type({"$ref": "#/definitions/Name"}, root_schema) is str
+    assert (id(root_schema), "#/definitions/Name") in reference_resolver._resolved_refs